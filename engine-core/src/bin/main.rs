@@ -29,11 +29,20 @@ fn handle_connection(engine: &JsonRpcEngine, conn: &mut TcpConnection) -> Result
             ServerRequest::Bye => break,
             ServerRequest::GetLogs(qs) => {
                 RUNTIME.block_on(async {
-                    let mut res =
+                    let res =
                         engine.get_logs(qs.from_block, qs.to_block, qs.filters).await.unwrap();
-                    while let Some(log) = res.next().await {
-                        let log = log.unwrap();
-                        writer.write_row(&log).unwrap();
+                    if qs.batch_size > 1 {
+                        let mut res = res.ready_chunks(qs.batch_size);
+                        while let Some(logs) = res.next().await {
+                            let logs = logs.into_iter().collect::<Result<Vec<_>, _>>().unwrap();
+                            writer.write_rows(&logs).unwrap();
+                        }
+                    } else {
+                        let mut res = res;
+                        while let Some(log) = res.next().await {
+                            let log = log.unwrap();
+                            writer.write_row(&log).unwrap();
+                        }
                     }
                 });
             }
@@ -24,6 +24,11 @@ impl<'a> TcpWriter<'a> {
         self.conn.write_row(v)
     }
 
+    pub fn write_rows<T: Serialize>(&mut self, v: &[T]) -> Result<(), Error> {
+        self.count += v.len() as u64;
+        self.conn.write_rows(v)
+    }
+
     pub fn write_end(&mut self) -> Result<(), Error> {
         self.conn.write_end(self.count)
     }
@@ -65,6 +70,11 @@ impl TcpConnection {
         self.write_bytes(&data)
     }
 
+    fn write_rows<T: Serialize>(&mut self, v: &[T]) -> Result<(), Error> {
+        let data = rmp_serde::to_vec(&ServerResponse::RowBatch(v))?;
+        self.write_bytes(&data)
+    }
+
     fn write_end(&mut self, v: u64) -> Result<(), Error> {
         let data = rmp_serde::to_vec(&ServerResponse::<()>::End(v))?;
         self.write_bytes(&data)?;
@@ -7,6 +7,8 @@ pub struct GetLogsArg {
     pub from_block: i64,
     pub to_block: i64,
     pub filters: Vec<(Address, Hash)>,
+    #[serde(default)]
+    pub batch_size: usize, // Max rows per RowBatch frame; 0 means one Row frame per log
 }
 
 #[derive(Deserialize)]
@@ -18,8 +20,9 @@ pub enum ServerRequest {
 
 #[derive(Serialize)]
 pub enum ServerResponse<'a, T> {
-    Row(&'a T),     // Data row to client
-    End(u64),       // End frame with total row count
-    Error(&'a str), // Frame Error with message string
-    Fatal(&'a str), // Fatal error with message string
+    Row(&'a T),           // Data row to client
+    RowBatch(&'a [T]),    // Batch of data rows to client
+    End(u64),             // End frame with total row count
+    Error(&'a str),       // Frame Error with message string
+    Fatal(&'a str),       // Fatal error with message string
 }
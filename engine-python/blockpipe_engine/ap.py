@@ -1,25 +1,30 @@
 import os
 import msgpack
 
-from .rw import Writer, ReaderNonBlocking, ReaderInterval, READ_INTERVAL, NO_DATA
+from .rw import READ_INTERVAL, NO_DATA
 from .msg import MsgGetLogs, MsgLog
 from .client import Client
 
 
+DEFAULT_BATCH_SIZE = 512
+
+
 class ApplicationProcess:
-    def __init__(self, app, port):
+    def __init__(self, app, port, batch_size=DEFAULT_BATCH_SIZE):
         self.app = app
         self.client = Client('0.0.0.0', port)
+        self.batch_size = batch_size
 
-    def run_and_exit(self, recv_id, send_id):
-        writer = Writer(send_id)
-        reader = ReaderNonBlocking(os.dup(recv_id))
-        msg = MsgGetLogs(8500000, 8700000, self.app.get_filters())
+    def run_and_exit(self, recv, send):
+        writer = send.writer()
+        reader = recv.reader_nonblocking()
+        msg = MsgGetLogs(8500000, 8700000, self.app.get_filters(),
+                         self.batch_size)
         self.client.write(msg.to_bytes())
         while True:
             e = reader.read()
             if e != NO_DATA:
-                writer.write(self.app.query(e))
+                writer.write(self.app.query(e).json())
                 continue
             data = self.client.read()
             if not data:
@@ -27,11 +32,14 @@ class ApplicationProcess:
             v = msgpack.unpackb(data)
             if 'End' in v:
                 break
+            if 'RowBatch' in v:
+                self.app.apply_logs(MsgLog.from_batch(v))
+                continue
             log = MsgLog.from_bytes(v)
             self.app.apply_log(log)
         self.client.write(msgpack.packb('Bye'))
         reader.close()
-        reader = ReaderInterval(recv_id, 0.5)
+        reader = recv.reader_interval(0.5)
         while True:
             data = reader.read()
             if data == READ_INTERVAL:
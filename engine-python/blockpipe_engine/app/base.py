@@ -22,5 +22,11 @@ class ApplicationBase:
         for func in self.handlers[(log.address, log.topics[0])]:
             func(log)
 
+    def apply_logs(self, logs):
+        handlers = self.handlers
+        for log in logs:
+            for func in handlers.get((log.address, log.topics[0]), ()):
+                func(log)
+
     def query(self, path):
         return self.client.get(path)
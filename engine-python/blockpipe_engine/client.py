@@ -1,30 +1,57 @@
 import socket
+import struct
+
+
+DEFAULT_RECV_SIZE = 1 << 20
 
 
 class Client:
-    def __init__(self, host, port):
+    def __init__(self, host, port, recv_size=DEFAULT_RECV_SIZE):
         self.sock = socket.socket()
         self.sock.connect((host, port))
-        self.buffer = bytearray()
+        self.recv_size = recv_size
+        self.buffer = bytearray(2 * recv_size)
+        self.view = memoryview(self.buffer)
         self.buffer_index = 0
+        self.buffer_end = 0
 
     def write(self, data):
         self.sock.sendall(len(data).to_bytes(4, 'big'))
         self.sock.sendall(data)
 
     def read(self):
-        size = int.from_bytes(self._read_exact(4), 'big')
-        return self._read_exact(size)
-
-    def _read_exact(self, num_bytes):
-        if self.buffer_index > 65536:
-            self.buffer = self.buffer[self.buffer_index:]
-            self.buffer_index = 0
-        while len(self.buffer) - self.buffer_index < num_bytes:
-            new_data = self.sock.recv(4096)
-            if not new_data:
-                raise IOError('Could not receive enough data')
-            self.buffer.extend(new_data)
-        data = self.buffer[self.buffer_index:self.buffer_index + num_bytes]
-        self.buffer_index += num_bytes
+        # The returned memoryview points into the receive buffer and is only
+        # valid until the next call to read.
+        self._fill(4)
+        size, = struct.unpack_from('>I', self.buffer, self.buffer_index)
+        self.buffer_index += 4
+        self._fill(size)
+        data = self.view[self.buffer_index:self.buffer_index + size]
+        self.buffer_index += size
         return data
+
+    def _fill(self, num_bytes):
+        if self.buffer_end - self.buffer_index >= num_bytes:
+            return
+        if self.buffer_index + num_bytes > len(self.buffer) or \
+                len(self.buffer) - self.buffer_end < self.recv_size // 2:
+            self._compact(num_bytes)
+        while self.buffer_end - self.buffer_index < num_bytes:
+            received = self.sock.recv_into(self.view[self.buffer_end:])
+            if not received:
+                raise IOError('Could not receive enough data')
+            self.buffer_end += received
+
+    def _compact(self, num_bytes):
+        pending = self.buffer_end - self.buffer_index
+        if num_bytes + self.recv_size > len(self.buffer):
+            # Frame does not fit; switch to a larger buffer. Views handed out
+            # earlier keep the old buffer alive, so it is never resized.
+            buffer = bytearray(num_bytes + self.recv_size)
+            buffer[:pending] = self.view[self.buffer_index:self.buffer_end]
+            self.buffer = buffer
+            self.view = memoryview(buffer)
+        else:
+            self.view[:pending] = self.view[self.buffer_index:self.buffer_end]
+        self.buffer_index = 0
+        self.buffer_end = pending
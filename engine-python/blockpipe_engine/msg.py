@@ -7,11 +7,13 @@ class MsgGetLogs:
     from_block: int
     to_block: int
     filters: list[tuple[bytes, bytes]]
+    batch_size: int = 0
 
     def to_bytes(self):
-        return msgpack.packb({
-            'GetLogs': [self.from_block, self.to_block, self.filters],
-        })
+        args = [self.from_block, self.to_block, self.filters]
+        if self.batch_size:
+            args.append(self.batch_size)
+        return msgpack.packb({'GetLogs': args})
 
 
 @dataclass
@@ -28,7 +30,14 @@ class MsgLog:
 
     @classmethod
     def from_bytes(cls, data):
-        data = data['Row']
+        return cls.from_row(data['Row'])
+
+    @classmethod
+    def from_batch(cls, data):
+        return [cls.from_row(row) for row in data['RowBatch']]
+
+    @classmethod
+    def from_row(cls, data):
         return cls(
             block_number=data[0],
             block_hash=data[1],
@@ -40,6 +40,8 @@ class Writer:
 
 
 class Reader:
+    loads = staticmethod(pickle.loads)
+
     def __init__(self, fd):
         self.fd = fd
         self.buffer = bytearray()
@@ -57,7 +59,7 @@ class Reader:
             return None
         data = self.buffer[self.buffer_index+4:self.buffer_index+4+size]
         self.buffer_index += 4+size
-        return pickle.loads(data)
+        return self.loads(data)
 
     def read(self):
         while True:
@@ -122,3 +124,35 @@ class ReaderInterval(Reader):
 
     def close(self):
         return super().close()
+
+
+class PipeEnd:
+    def __init__(self, fd):
+        self.fd = fd
+
+    def writer(self):
+        return Writer(self.fd)
+
+    def reader(self):
+        return Reader(self.fd)
+
+    def reader_nonblocking(self):
+        return ReaderNonBlocking(os.dup(self.fd))
+
+    def reader_interval(self, timeout):
+        return ReaderInterval(self.fd, timeout)
+
+    def detach(self):
+        os.close(self.fd)
+
+
+def open_channel(transport='pipe'):
+    """Returns a (recv_end, send_end) pair for a one-way message channel."""
+    if transport == 'pipe':
+        recv_fd, send_fd = os.pipe()
+        return PipeEnd(recv_fd), PipeEnd(send_fd)
+    if transport == 'shm':
+        from .shm import ShmRing
+        ring = ShmRing()
+        return ring, ring
+    raise ValueError(f'Unknown transport "{transport}"')
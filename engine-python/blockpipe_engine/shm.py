@@ -0,0 +1,185 @@
+import mmap
+import os
+import selectors
+import struct
+import time
+import msgpack
+
+from .rw import Reader, READ_INTERVAL, NO_WRITER, NO_DATA
+
+
+DEFAULT_SHM_SIZE = 1 << 22
+
+# Shared header: total bytes written, total bytes read, writer closed flag.
+WRITE_OFFSET = 0
+READ_OFFSET = 8
+CLOSED_OFFSET = 16
+HEADER_SIZE = 24
+COUNTER = struct.Struct('=Q')
+
+
+class ShmRing:
+    """Single-producer single-consumer byte ring in anonymous shared memory.
+
+    Must be created before fork. The writer rings the doorbell eventfd after
+    each message; the reader signals the space eventfd once it frees up enough
+    room for a blocked writer to make progress."""
+
+    def __init__(self, size=DEFAULT_SHM_SIZE):
+        self.size = size
+        self.mm = mmap.mmap(-1, HEADER_SIZE + size)
+        self.doorbell = os.eventfd(0, os.EFD_CLOEXEC)
+        self.space = os.eventfd(0, os.EFD_CLOEXEC)
+
+    def _get(self, offset):
+        return COUNTER.unpack_from(self.mm, offset)[0]
+
+    def _set(self, offset, value):
+        COUNTER.pack_into(self.mm, offset, value)
+
+    @property
+    def closed(self):
+        return self._get(CLOSED_OFFSET) != 0
+
+    def send(self, data):
+        self._put(len(data).to_bytes(4, 'big'))
+        self._put(data)
+        os.eventfd_write(self.doorbell, 1)
+
+    def _put(self, data):
+        view = memoryview(data)
+        written = self._get(WRITE_OFFSET)
+        while view:
+            free = self.size - (written - self._get(READ_OFFSET))
+            if free == 0:
+                os.eventfd_write(self.doorbell, 1)
+                os.eventfd_read(self.space)
+                continue
+            n = min(free, len(view))
+            start = written % self.size
+            first = min(n, self.size - start)
+            self.mm[HEADER_SIZE + start:HEADER_SIZE + start + first] = view[:first]
+            if n > first:
+                self.mm[HEADER_SIZE:HEADER_SIZE + n - first] = view[first:n]
+            written += n
+            self._set(WRITE_OFFSET, written)
+            view = view[n:]
+
+    def drain_into(self, buffer):
+        read = self._get(READ_OFFSET)
+        n = self._get(WRITE_OFFSET) - read
+        if not n:
+            return 0
+        start = read % self.size
+        first = min(n, self.size - start)
+        mm = memoryview(self.mm)
+        buffer.extend(mm[HEADER_SIZE + start:HEADER_SIZE + start + first])
+        if n > first:
+            buffer.extend(mm[HEADER_SIZE:HEADER_SIZE + n - first])
+        mm.release()
+        self._set(READ_OFFSET, read + n)
+        if n >= self.size // 2:
+            os.eventfd_write(self.space, 1)
+        return n
+
+    def shutdown(self):
+        self._set(CLOSED_OFFSET, 1)
+        os.eventfd_write(self.doorbell, 1)
+
+    def writer(self):
+        return ShmWriter(self)
+
+    def reader(self):
+        return ShmReader(self)
+
+    def reader_nonblocking(self):
+        return ShmReaderNonBlocking(self)
+
+    def reader_interval(self, timeout):
+        return ShmReaderInterval(self, timeout)
+
+    def detach(self):
+        # Both ends share the same mapping; nothing to release per end.
+        pass
+
+
+class ShmWriter:
+    def __init__(self, ring):
+        self.ring = ring
+
+    def write(self, v):
+        self.ring.send(msgpack.packb(v))
+
+    def close(self):
+        self.ring.shutdown()
+
+
+class ShmReader(Reader):
+    loads = staticmethod(msgpack.unpackb)
+
+    def __init__(self, ring):
+        super().__init__(ring.doorbell)
+        self.ring = ring
+
+    def read(self):
+        while True:
+            data = self.parse_data()
+            if data is not None:
+                return data
+            # Check the flag before draining: the writer only sets it after
+            # its last message, so nothing can be left behind.
+            closed = self.ring.closed
+            if self.ring.drain_into(self.buffer):
+                continue
+            if closed:
+                return NO_WRITER
+            os.eventfd_read(self.fd)
+
+    def close(self):
+        # The doorbell belongs to the ring and may be picked up by another
+        # reader on the same channel.
+        pass
+
+
+class ShmReaderNonBlocking(ShmReader):
+    def read(self):
+        data = self.parse_data()
+        if data is not None:
+            return data
+        closed = self.ring.closed
+        if self.ring.drain_into(self.buffer):
+            data = self.parse_data()
+            if data is not None:
+                return data
+        elif closed:
+            return NO_WRITER
+        return NO_DATA
+
+
+class ShmReaderInterval(ShmReader):
+    def __init__(self, ring, timeout):
+        super().__init__(ring)
+        self.timeout = timeout
+        self.last_timeout = 0
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.fd, selectors.EVENT_READ)
+
+    def read(self):
+        while True:
+            now = time.time()
+            if now > self.last_timeout + self.timeout:
+                self.last_timeout = now
+                return READ_INTERVAL
+            data = self.parse_data()
+            if data is not None:
+                return data
+            closed = self.ring.closed
+            if self.ring.drain_into(self.buffer):
+                continue
+            if closed:
+                return NO_WRITER
+            if self.selector.select(self.timeout / 10):
+                os.eventfd_read(self.fd)
+
+    def close(self):
+        self.selector.close()
@@ -3,8 +3,6 @@ import time
 import uvicorn
 from fastapi import FastAPI, Request, Response
 
-from .rw import Reader, Writer
-
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +12,10 @@ class WebserverProcess:
         self.name = name
         self.port = port
 
-    def run_and_exit(self, recv_id, send_id):
+    def run_and_exit(self, recv, send):
         app = FastAPI()
-        r = Reader(recv_id)
-        w = Writer(send_id)
+        r = recv.reader()
+        w = send.writer()
 
         @app.get(f'/{self.name}' + '/{path:path}')
         async def handle_request(req: Request, res: Response, path: str):
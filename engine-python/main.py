@@ -9,6 +9,7 @@ from blockpipe_engine.client import Client
 from blockpipe_engine.msg import MsgGetLogs, MsgLog
 from blockpipe_engine.web import WebserverProcess
 from blockpipe_engine.ap import ApplicationProcess
+from blockpipe_engine.rw import open_channel
 
 
 class PrintToLogger:
@@ -33,24 +34,24 @@ def configure_print_to_logger():
     sys.stderr = PrintToLogger(sys.stderr, logger.error)
 
 
-def fork_spawn(parent_cls, parent_args, child_cls, child_args):
-    child_recv_id, parent_send_id = os.pipe()
-    parent_recv_id, child_send_id = os.pipe()
+def fork_spawn(parent_cls, parent_args, child_cls, child_args, transport='pipe'):
+    child_recv, parent_send = open_channel(transport)
+    parent_recv, child_send = open_channel(transport)
     pid = os.fork()
     if pid == 0:  # child
-        os.close(parent_recv_id)
-        os.close(parent_send_id)
+        parent_recv.detach()
+        parent_send.detach()
         child = child_cls(*child_args)
-        child.run_and_exit(child_recv_id, child_send_id)
+        child.run_and_exit(child_recv, child_send)
         exit(0)
     else:  # parent
-        os.close(child_recv_id)
-        os.close(child_send_id)
+        child_recv.detach()
+        child_send.detach()
         parent = parent_cls(*parent_args)
-        parent.run_and_exit(parent_recv_id, parent_send_id)
+        parent.run_and_exit(parent_recv, parent_send)
 
 
-def main():
+def main(transport: str = typer.Option('shm' if hasattr(os, 'eventfd') else 'pipe')):
     logging.basicConfig(format='[%(levelname)s]: %(message)s', datefmt='%Y-%m-%d %H:%M:%S',
                         level=logging.INFO, handlers=[logging.StreamHandler(sys.stdout)])
     httpx_logger = logging.getLogger('httpx')
@@ -65,6 +66,7 @@ def main():
         ('blockpipe', 8888),
         ApplicationProcess,
         (app, 9167),
+        transport,
     )
 
     # client = Client('0.0.0.0', 9167)
@@ -0,0 +1,56 @@
+import socket
+
+import msgpack
+import pytest
+
+from blockpipe_engine.client import Client
+
+
+@pytest.fixture
+def connect():
+    server = socket.create_server(('127.0.0.1', 0))
+    conns = []
+
+    def connect(recv_size):
+        client = Client('127.0.0.1', server.getsockname()[1], recv_size)
+        conn, _ = server.accept()
+        conns.append((client, conn))
+        return client, conn
+
+    yield connect
+    for client, conn in conns:
+        client.sock.close()
+        conn.close()
+    server.close()
+
+
+def frame(data):
+    return len(data).to_bytes(4, 'big') + data
+
+
+def test_read_frames(connect):
+    client, conn = connect(64)
+    payloads = [msgpack.packb({'Row': [i, b'x' * (i * 7)]}) for i in range(50)]
+    conn.sendall(b''.join(frame(p) for p in payloads))
+    for payload in payloads:
+        data = client.read()
+        assert isinstance(data, memoryview)
+        assert msgpack.unpackb(data) == msgpack.unpackb(payload)
+
+
+def test_read_frame_larger_than_buffer(connect):
+    client, conn = connect(16)
+    big = bytes(range(256)) * 10
+    conn.sendall(frame(b'small') + frame(big) + frame(b'tail'))
+    assert client.read() == b'small'
+    view = client.read()
+    assert view == big
+    assert client.read() == b'tail'
+
+
+def test_read_closed(connect):
+    client, conn = connect(16)
+    conn.sendall(frame(b'abc')[:5])
+    conn.close()
+    with pytest.raises(IOError):
+        client.read()
@@ -0,0 +1,41 @@
+import msgpack
+
+from blockpipe_engine.msg import MsgGetLogs, MsgLog
+
+
+ADDRESS = bytes.fromhex('ba11d00c5f74255f56a5e366f4f77f5a186d7f55')
+TOPIC0 = bytes.fromhex(
+    'ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef')
+
+
+def make_row(block_number, log_index):
+    return [block_number, b'\x01' * 32, 0, log_index, b'\x02' * 32, 0,
+            ADDRESS, [TOPIC0], b'']
+
+
+def test_get_logs_to_bytes():
+    msg = MsgGetLogs(1, 2, [(ADDRESS, TOPIC0)])
+    assert msgpack.unpackb(msg.to_bytes()) == {
+        'GetLogs': [1, 2, [[ADDRESS, TOPIC0]]],
+    }
+    msg = MsgGetLogs(1, 2, [(ADDRESS, TOPIC0)], batch_size=64)
+    assert msgpack.unpackb(msg.to_bytes()) == {
+        'GetLogs': [1, 2, [[ADDRESS, TOPIC0]], 64],
+    }
+
+
+def test_log_from_bytes():
+    frame = msgpack.unpackb(msgpack.packb({'Row': make_row(10, 3)}))
+    log = MsgLog.from_bytes(frame)
+    assert log.block_number == 10
+    assert log.log_index == 3
+    assert log.address == ADDRESS
+    assert log.topics == [TOPIC0]
+
+
+def test_log_from_batch():
+    rows = [make_row(10, idx) for idx in range(5)]
+    frame = msgpack.unpackb(msgpack.packb({'RowBatch': rows}))
+    logs = MsgLog.from_batch(frame)
+    assert [log.log_index for log in logs] == [0, 1, 2, 3, 4]
+    assert logs[0] == MsgLog.from_row(rows[0])
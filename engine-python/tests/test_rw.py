@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from blockpipe_engine.rw import open_channel, NO_DATA, NO_WRITER
+from blockpipe_engine.shm import ShmRing
+
+
+def spawn_writer(send, messages):
+    pid = os.fork()
+    if pid == 0:
+        writer = send.writer()
+        for message in messages:
+            writer.write(message)
+        writer.close()
+        os._exit(0)
+    return pid
+
+
+@pytest.mark.parametrize('transport', ['pipe', 'shm'])
+def test_channel_roundtrip(transport):
+    recv, send = open_channel(transport)
+    messages = ['/total_supply', {'balance': 10**30}, 'x' * 100000, [1, 2, 3]]
+    pid = spawn_writer(send, messages)
+    send.detach()
+    reader = recv.reader()
+    assert [reader.read() for _ in messages] == messages
+    assert reader.read() == NO_WRITER
+    os.waitpid(pid, 0)
+
+
+def test_shm_ring_wraps_around():
+    ring = ShmRing(size=64)
+    messages = [bytes([i]) * (i * 13 % 200) for i in range(100)]
+    pid = spawn_writer(ring, messages)
+    reader = ring.reader()
+    assert [reader.read() for _ in messages] == messages
+    assert reader.read() == NO_WRITER
+    os.waitpid(pid, 0)
+
+
+def test_shm_reader_nonblocking():
+    ring = ShmRing(size=1024)
+    reader = ring.reader_nonblocking()
+    assert reader.read() == NO_DATA
+    writer = ring.writer()
+    writer.write('/balance/0x00')
+    writer.write({'a': 1})
+    assert reader.read() == '/balance/0x00'
+    assert reader.read() == {'a': 1}
+    assert reader.read() == NO_DATA
+    writer.close()
+    assert reader.read() == NO_WRITER